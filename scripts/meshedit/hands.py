@@ -1,5 +1,6 @@
 #!/usr/bin/env python3
 import sys
+import struct
 import subprocess
 
 # Auto-install dependencies if missing
@@ -8,7 +9,9 @@ try:
     import cv2
     import mediapipe as mp
 except ModuleNotFoundError:
-    subprocess.check_call([sys.executable, "-m", "pip", "install", "--user"] + required)
+    # Keep pip's output off stdout, which carries the binary landmark stream
+    subprocess.check_call([sys.executable, "-m", "pip", "install", "--user"] + required,
+                          stdout=subprocess.DEVNULL)
     import cv2
     import mediapipe as mp
 
@@ -18,25 +21,55 @@ parser = argparse.ArgumentParser(description="Hand tracking utility (headless mo
 parser.add_argument("--headless", action="store_true", help="Run in headless mode for event streaming")
 args = parser.parse_args()
 
+# Frames wider than this are downscaled before tracking; landmarks are
+# normalized, so the output does not depend on the tracking resolution.
+TRACK_WIDTH = 320
+
+# One record per frame: sync marker, then thumb x/y, index x/y, squared pinch
+# distance (little-endian float32). The reader resynchronizes on the marker if
+# anything else ever lands on stdout.
+MAGIC = b"HND1"
+RECORD = struct.Struct("<4s5f")
+
+
+def clamp01(v):
+    return min(max(v, 0.0), 1.0)
+
+
 if args.headless:
+    out = sys.stdout.buffer
     cap = cv2.VideoCapture(0)
+    # Keep only the newest frame queued so tracking never lags behind the camera
+    cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
     with mp.solutions.hands.Hands(
         model_complexity=0,
         max_num_hands=1,
         min_detection_confidence=0.5,
         min_tracking_confidence=0.5
     ) as hands:
+        small = None
+        image = None
         while cap.isOpened():
             success, frame = cap.read()
             if not success:
                 continue
-            image = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+            if frame.shape[1] > TRACK_WIDTH:
+                height = frame.shape[0] * TRACK_WIDTH // frame.shape[1]
+                small = cv2.resize(frame, (TRACK_WIDTH, height), dst=small, interpolation=cv2.INTER_AREA)
+                frame = small
+            image = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=image)
             results = hands.process(image)
             if results.multi_hand_landmarks:
                 lm = results.multi_hand_landmarks[0]
                 thumb = lm.landmark[mp.solutions.hands.HandLandmark.THUMB_TIP]
                 index = lm.landmark[mp.solutions.hands.HandLandmark.INDEX_FINGER_TIP]
-                dist = ((thumb.x - index.x)**2 + (thumb.y - index.y)**2) ** 0.5
-                print(f"{thumb.x} {thumb.y} {index.x} {index.y} {dist}", flush=True)
+                # Pinch distance uses the raw landmarks: clamping would collapse fingers
+                # that leave the frame on the same side into a false pinch
+                dx = thumb.x - index.x
+                dy = thumb.y - index.y
+                # Landmarks can fall slightly outside the frame; the reader only accepts [0, 1]
+                out.write(RECORD.pack(MAGIC, clamp01(thumb.x), clamp01(thumb.y),
+                                      clamp01(index.x), clamp01(index.y), dx * dx + dy * dy))
+                out.flush()
     cap.release()
     sys.exit(0)
\ No newline at end of file
@@ -1,4 +1,5 @@
 using System;
+using System.Buffers.Binary;
 using System.Collections.Generic;
 using System.Linq;
 using Eto.Forms;
@@ -29,6 +30,11 @@ namespace crft
         // Default camera resolution for hand tracking overlay
         private const int CamWidth = 640;
         private const int CamHeight = 480;
+        // hands.py record: "HND1" sync marker, then thumb x/y, index x/y, squared pinch distance as little-endian float32
+        private static readonly byte[] HandRecordMagic = { (byte)'H', (byte)'N', (byte)'D', (byte)'1' };
+        private const int HandRecordSize = 4 + 5 * sizeof(float);
+        // Pinch when thumb and index tips are closer than 0.08 (normalized), compared squared
+        private const float PinchDistanceSq = 0.08f * 0.08f;
         private readonly float _pinchThreshold = 60f;
         private bool _isLassoing = false;
         private List<PointF> _lassoPath = new List<PointF>();
@@ -46,6 +52,16 @@ namespace crft
         private PointF _lastMouse;
         private PointF? _handCursor;
         private bool _rotating, _panning;
+        // View rotation terms, refreshed only when yaw/pitch change
+        private float _viewYaw = float.NaN, _viewPitch = float.NaN;
+        private float _cosYaw, _sinYaw, _cosPitch, _sinPitch;
+        // Screen-space vertex buffer reused between projections
+        private PointF[] _projected = Array.Empty<PointF>();
+        // Unnormalized face normals, recomputed only after vertices move
+        private Vector3d[] _faceNormals;
+        // Per-face front/back classification, reused across repaints
+        private bool[] _frontFacing = Array.Empty<bool>();
+        private bool _faceNormalsDirty = true;
 
 
         /// <summary>
@@ -176,6 +192,21 @@ namespace crft
             _zoom = Math.Min(w, h) / (float)span;
         }
 
+        private void ComputeFaceNormals()
+        {
+            if (_faceNormals == null || _faceNormals.Length != _faces.Count)
+                _faceNormals = new Vector3d[_faces.Count];
+            for (int f = 0; f < _faces.Count; f++)
+            {
+                var face = _faces[f];
+                var a = _vertices[face[0]];
+                var b = _vertices[face[1]];
+                var c = _vertices[face[2]];
+                _faceNormals[f] = Vector3d.CrossProduct(b - a, c - a);
+            }
+            _faceNormalsDirty = false;
+        }
+
         private void ResetView()
         {
             _yaw = MathF.PI / 4f;
@@ -209,46 +240,41 @@ namespace crft
             var cx = cw / 2f + _panX;
             var cy = ch / 2f + _panY;
             // Compute view direction for shading
+            UpdateViewTransform();
             var viewDir = new Vector3d(
-                Math.Sin(_pitch) * Math.Sin(_yaw),
-                Math.Sin(_pitch) * Math.Cos(_yaw),
-                Math.Cos(_pitch)
+                _sinPitch * _sinYaw,
+                _sinPitch * _cosYaw,
+                _cosPitch
             );
+            var projected = ProjectAll(cx, cy);
+            // Face normals only change with geometry; view-only repaints reuse them
+            if (_faceNormalsDirty)
+                ComputeFaceNormals();
+            // Classify faces once; only the sign of the dot product matters
+            if (_frontFacing.Length != _faces.Count)
+                _frontFacing = new bool[_faces.Count];
+            var frontFacing = _frontFacing;
+            for (int f = 0; f < _faces.Count; f++)
+                frontFacing[f] = Vector3d.Multiply(_faceNormals[f], viewDir) >= 0;
             // Draw back faces first
-            foreach (var face in _faces)
+            for (int f = 0; f < _faces.Count; f++)
             {
-                var a = _vertices[face[0]];
-                var b = _vertices[face[1]];
-                var c = _vertices[face[2]];
-                var normal = Vector3d.CrossProduct(b - a, c - a);
-                normal.Unitize();
-                var dot = Vector3d.Multiply(normal, viewDir);
-                if (dot < 0)
-                {
-                    var pts2d = face.Select(idx => Project(_vertices[idx], cx, cy)).ToArray();
-                    using var brush = new SolidBrush(new Color(0.6f, 0.6f, 0.6f));
-                    using var pen = new Pen(Colors.Black, 1);
-                    g.FillPolygon(brush, pts2d);
-                    g.DrawPolygon(pen, pts2d);
-                }
+                if (frontFacing[f]) continue;
+                var pts2d = _faces[f].Select(idx => projected[idx]).ToArray();
+                using var brush = new SolidBrush(new Color(0.6f, 0.6f, 0.6f));
+                using var pen = new Pen(Colors.Black, 1);
+                g.FillPolygon(brush, pts2d);
+                g.DrawPolygon(pen, pts2d);
             }
             // Draw front faces
-            foreach (var face in _faces)
+            for (int f = 0; f < _faces.Count; f++)
             {
-                var a = _vertices[face[0]];
-                var b = _vertices[face[1]];
-                var c = _vertices[face[2]];
-                var normal = Vector3d.CrossProduct(b - a, c - a);
-                normal.Unitize();
-                var dot = Vector3d.Multiply(normal, viewDir);
-                if (dot >= 0)
-                {
-                    var pts2d = face.Select(idx => Project(_vertices[idx], cx, cy)).ToArray();
-                    using var brush = new SolidBrush(new Color(0.8f, 0.8f, 0.8f));
-                    using var pen = new Pen(Colors.Black, 1);
-                    g.FillPolygon(brush, pts2d);
-                    g.DrawPolygon(pen, pts2d);
-                }
+                if (!frontFacing[f]) continue;
+                var pts2d = _faces[f].Select(idx => projected[idx]).ToArray();
+                using var brush = new SolidBrush(new Color(0.8f, 0.8f, 0.8f));
+                using var pen = new Pen(Colors.Black, 1);
+                g.FillPolygon(brush, pts2d);
+                g.DrawPolygon(pen, pts2d);
             }
             // Draw lasso path in edit mode
             if (_mode == Mode.Edit && _isLassoing && _lassoPath.Count > 1)
@@ -262,7 +288,7 @@ namespace crft
                 using var brush = new SolidBrush(Colors.Red);
                 foreach (var idx in _selectedVertices)
                 {
-                    var p2 = Project(_vertices[idx], cx, cy);
+                    var p2 = projected[idx];
                     g.FillEllipse(brush, p2.X - 4, p2.Y - 4, 8, 8);
                 }
             }
@@ -275,20 +301,60 @@ namespace crft
             }
         }
 
+        /// <summary>
+        /// Refresh the cached view rotation terms if yaw or pitch changed.
+        /// </summary>
+        private void UpdateViewTransform()
+        {
+            if (_yaw == _viewYaw && _pitch == _viewPitch)
+                return;
+            _cosYaw = MathF.Cos(_yaw);
+            _sinYaw = MathF.Sin(_yaw);
+            _cosPitch = MathF.Cos(_pitch);
+            _sinPitch = MathF.Sin(_pitch);
+            _viewYaw = _yaw;
+            _viewPitch = _pitch;
+        }
+
         private PointF Project(Point3d p, float cx, float cy)
         {
+            UpdateViewTransform();
             var v = p - _center;
-            var c = MathF.Cos(_yaw);
-            var s = MathF.Sin(_yaw);
-            var x1 = (float)(v.X * c - v.Y * s);
-            var y1 = (float)(v.X * s + v.Y * c);
+            var x1 = (float)(v.X * _cosYaw - v.Y * _sinYaw);
+            var y1 = (float)(v.X * _sinYaw + v.Y * _cosYaw);
             var z1 = (float)v.Z;
-            var cp = MathF.Cos(_pitch);
-            var sp = MathF.Sin(_pitch);
-            var y2 = y1 * cp - z1 * sp;
+            var y2 = y1 * _cosPitch - z1 * _sinPitch;
             return new PointF(x1 * _zoom + cx, -y2 * _zoom + cy);
         }
 
+        /// <summary>
+        /// Project every vertex to screen space with the cached view rotation.
+        /// The returned buffer is reused and overwritten by the next call.
+        /// </summary>
+        private PointF[] ProjectAll(float cx, float cy)
+        {
+            UpdateViewTransform();
+            var c = _cosYaw;
+            var s = _sinYaw;
+            var cp = _cosPitch;
+            var sp = _sinPitch;
+            var center = _center;
+            var zoom = _zoom;
+            var vertices = _vertices;
+            if (_projected.Length != vertices.Count)
+                _projected = new PointF[vertices.Count];
+            var result = _projected;
+            for (int i = 0; i < result.Length; i++)
+            {
+                var v = vertices[i] - center;
+                var x1 = (float)(v.X * c - v.Y * s);
+                var y1 = (float)(v.X * s + v.Y * c);
+                var y2 = y1 * cp - (float)v.Z * sp;
+                result[i] = new PointF(x1 * zoom + cx, -y2 * zoom + cy);
+            }
+            return result;
+        }
+
         private Point3d Unproject(PointF sp, double origZ)
         {
             float cx = ClientSize.Width * 0.5f + _panX;
@@ -296,11 +362,12 @@ namespace crft
             float x1 = (sp.X - cx) / _zoom;
             float y2 = -(sp.Y - cy) / _zoom;
             float z1 = (float)(origZ - _center.Z);
-            var spch = MathF.Sin(_pitch);
-            var cpch = MathF.Cos(_pitch);
+            UpdateViewTransform();
+            var spch = _sinPitch;
+            var cpch = _cosPitch;
             float y1 = (y2 + z1 * spch) / cpch;
-            var sy = MathF.Sin(_yaw);
-            var cyaw = MathF.Cos(_yaw);
+            var sy = _sinYaw;
+            var cyaw = _cosYaw;
             float Xc = x1 * cyaw + y1 * sy;
             float Yc = -x1 * sy + y1 * cyaw;
             double wx = Xc + _center.X;
@@ -362,6 +429,9 @@ namespace crft
 
         private void Canvas_MouseMove(object sender, MouseEventArgs e)
         {
+            // Nothing moved: skip vertex updates and the repaint
+            if (e.Location == _lastMouse)
+                return;
             var delta = new PointF(e.Location.X - _lastMouse.X, e.Location.Y - _lastMouse.Y);
             if (_mode == Mode.View)
             {
@@ -387,6 +457,7 @@ namespace crft
                     var deltaWorld = currWorld - _dragAnchorWorld;
                     for (int i = 0; i < _selectedVertices.Count; i++)
                         _vertices[_selectedVertices[i]] = _initialSelected[i] + deltaWorld;
+                    _faceNormalsDirty = true;
                     _canvas.Invalidate();
                 }
                 else if (_isLassoing)
@@ -443,11 +514,20 @@ namespace crft
             _selectedVertices.Clear();
             float cx = ClientSize.Width * 0.5f + _panX;
             float cy = ClientSize.Height * 0.5f + _panY;
-            for (int i = 0; i < _vertices.Count; i++)
+            // Lasso bounds: points outside cannot be inside the polygon
+            float minX = poly[0].X, maxX = poly[0].X, minY = poly[0].Y, maxY = poly[0].Y;
+            foreach (var p in poly)
+            {
+                if (p.X < minX) minX = p.X; else if (p.X > maxX) maxX = p.X;
+                if (p.Y < minY) minY = p.Y; else if (p.Y > maxY) maxY = p.Y;
+            }
+            var projected = ProjectAll(cx, cy);
+            for (int i = 0; i < projected.Length; i++)
             {
-                var pt3 = _vertices[i];
-                var pt2 = Project(pt3, cx, cy);
-                if (PointInPolygon(poly, pt2))
+                var pt = projected[i];
+                if (pt.X < minX || pt.X > maxX || pt.Y < minY || pt.Y > maxY)
+                    continue;
+                if (PointInPolygon(poly, pt))
                     _selectedVertices.Add(i);
             }
         }
@@ -518,16 +598,19 @@ namespace crft
                 _handTrackingThread = new Thread(() =>
                 {
                     bool pinched = false;
-                    string line;
-                    while (_handProcess != null && !_handProcess.HasExited && (line = _handProcess.StandardOutput.ReadLine()) != null)
+                    var stream = _handProcess.StandardOutput.BaseStream;
+                    var record = new byte[HandRecordSize];
+                    while (_handProcess != null && !_handProcess.HasExited && ReadHandRecord(stream, record))
                     {
-                        var parts = line.Split(' ');
-                        if (parts.Length < 5) continue;
-                        if (!float.TryParse(parts[0], out var tx)) continue;
-                        if (!float.TryParse(parts[1], out var ty)) continue;
-                        if (!float.TryParse(parts[2], out var ix)) continue;
-                        if (!float.TryParse(parts[3], out var iy)) continue;
-                        if (!float.TryParse(parts[4], out var dist)) continue;
+                        var tx = BinaryPrimitives.ReadSingleLittleEndian(record.AsSpan(4, 4));
+                        var ty = BinaryPrimitives.ReadSingleLittleEndian(record.AsSpan(8, 4));
+                        var ix = BinaryPrimitives.ReadSingleLittleEndian(record.AsSpan(12, 4));
+                        var iy = BinaryPrimitives.ReadSingleLittleEndian(record.AsSpan(16, 4));
+                        var distSq = BinaryPrimitives.ReadSingleLittleEndian(record.AsSpan(20, 4));
+                        // Drop records that cannot be normalized landmarks (also rejects NaN); the distance
+                        // comes from unclamped landmarks, so allow for points slightly outside the frame
+                        if (!(InUnitRange(tx) && InUnitRange(ty) && InUnitRange(ix) && InUnitRange(iy) && distSq >= 0f && distSq <= 4f))
+                            continue;
                         Application.Instance.Invoke(() =>
                         {
                             var cx = ClientSize.Width;
@@ -542,7 +625,7 @@ namespace crft
                             var downArgs = new MouseEventArgs(MouseButtons.Primary, Keys.None, loc, null, 1f);
                             var moveArgs = new MouseEventArgs(MouseButtons.Primary, Keys.None, loc, null, 1f);
                             var upArgs = new MouseEventArgs(MouseButtons.Primary, Keys.None, loc, null, 1f);
-                            if (!pinched && dist < 0.08f)
+                            if (!pinched && distSq < PinchDistanceSq)
                             {
                                 pinched = true;
                                 if (_mode == Mode.Edit && _selectedVertices.Count > 0)
@@ -553,11 +636,11 @@ namespace crft
                                     _dragAnchorWorld = Unproject(loc, _dragRefZ);
                                 }
                             }
-                            else if (pinched && dist < 0.08f)
+                            else if (pinched && distSq < PinchDistanceSq)
                             {
                                 Canvas_MouseMove(_canvas, moveArgs);
                             }
-                            else if (pinched && dist >= 0.08f)
+                            else if (pinched && distSq >= PinchDistanceSq)
                             {
                                 Canvas_MouseUp(_canvas, upArgs);
                                 pinched = false;
@@ -573,6 +656,40 @@ namespace crft
             }
         }
 
+        /// <summary>
+        /// Read the next hand record, sliding forward byte by byte until the sync marker lines up
+        /// again if stray output shifted the stream; false if the stream ends first.
+        /// </summary>
+        private static bool ReadHandRecord(Stream stream, byte[] record)
+        {
+            if (!ReadFully(stream, record)) return false;
+            while (!record.AsSpan(0, HandRecordMagic.Length).SequenceEqual(HandRecordMagic))
+            {
+                Buffer.BlockCopy(record, 1, record, 0, record.Length - 1);
+                int b = stream.ReadByte();
+                if (b < 0) return false;
+                record[record.Length - 1] = (byte)b;
+            }
+            return true;
+        }
+
+        private static bool InUnitRange(float v) => v >= 0f && v <= 1f;
+
+        /// <summary>
+        /// Fill the buffer from the stream; false if the stream ends first.
+        /// </summary>
+        private static bool ReadFully(Stream stream, byte[] buffer)
+        {
+            int offset = 0;
+            while (offset < buffer.Length)
+            {
+                int read = stream.Read(buffer, offset, buffer.Length - offset);
+                if (read <= 0) return false;
+                offset += read;
+            }
+            return true;
+        }
+
         private void StopHandTracking()
         {
             // TODO: stop hand tracking process
@@ -4,6 +4,7 @@ using System.Diagnostics;
 using System.IO;
 using System.Net;
 using System.Net.Sockets;
+using System.Security.Cryptography;
 using System.Text;
 using System.Threading.Tasks;
 using Eto.Forms;
@@ -23,6 +24,13 @@ namespace crft
     /// </summary>
     public class PhotogrammetryComponent : GH_Component
     {
+        // Longest edge of extracted frames; larger video frames are downscaled once by ffmpeg
+        private const int MaxFrameSize = 2000;
+        // Bump when frame extraction or reconstruction changes so older cached models are not reused
+        private const int ModelCacheVersion = 1;
+        // Most recently used models kept in the cache; older ones are deleted
+        private const int MaxCachedModels = 8;
+
         // State fields for asynchronous capture and processing
         private bool _startLast = false;
         private bool _serverStarted = false;
@@ -31,6 +39,8 @@ namespace crft
         private bool _finished = false;
         private int _port;
         private string _videoPath;
+        // SHA-256 of the uploaded video, used to key the model cache
+        private string _videoHash;
         private string _modelPath;
         private System.Net.HttpListener _listener;
         private System.Threading.Tasks.Task _serverTask;
@@ -49,7 +59,7 @@ namespace crft
         {
             pManager.AddBooleanParameter("Start", "S", "Activate camera capture and photogrammetry", GH_ParamAccess.item, false);
             pManager.AddTextParameter("Detail", "D", "Detail level {preview, reduced, medium, full, raw}", GH_ParamAccess.item, string.Empty);
-            pManager.AddTextParameter("Sample Ordering", "SO", "Sample ordering {unordered, sequential}", GH_ParamAccess.item, string.Empty);
+            pManager.AddTextParameter("Sample Ordering", "SO", "Sample ordering {unordered, sequential}; defaults to sequential for video frames", GH_ParamAccess.item, string.Empty);
             pManager.AddTextParameter("Feature Sensitivity", "FS", "Feature sensitivity value", GH_ParamAccess.item, string.Empty);
         }
 
@@ -203,8 +213,15 @@ namespace crft
                             }
                             Directory.CreateDirectory(dir);
                             _videoPath = Path.Combine(dir, "video.mp4");
-                            using var fs = File.Create(_videoPath);
-                            req.InputStream.CopyTo(fs);
+                            // Hash the upload while writing it so the model cache needs no second read
+                            using (var fs = File.Create(_videoPath))
+                            using (var sha = SHA256.Create())
+                            using (var hashing = new CryptoStream(fs, sha, CryptoStreamMode.Write))
+                            {
+                                req.InputStream.CopyTo(hashing);
+                                hashing.FlushFinalBlock();
+                                _videoHash = Convert.ToHexString(sha.Hash);
+                            }
                             resp.StatusCode = 200;
                             resp.Close();
                             // Notify video upload and trigger processing
@@ -283,6 +300,7 @@ document.getElementById('uploadForm').addEventListener('submit', function(e) {
             _processing = false;
             _finished = false;
             _videoPath = null;
+            _videoHash = null;
             _modelPath = null;
         }
 
@@ -292,17 +310,36 @@ document.getElementById('uploadForm').addEventListener('submit', function(e) {
             {
                 var dir = Path.Combine(Path.GetTempPath(), "gh_photogrammetry");
                 var framesDir = Path.Combine(dir, "frames");
+                // Frames are extracted from one video and therefore time-ordered; default to sequential
+                // so neighbouring frames are matched instead of every image pair
+                var sampleOrdering = string.IsNullOrWhiteSpace(_sampleOrdering) ? "sequential" : _sampleOrdering;
+                // Same video with the same options: reuse the previously reconstructed model
+                var cachedModelPath = GetCachedModelPath(sampleOrdering);
+                if (cachedModelPath != null && File.Exists(cachedModelPath))
+                {
+                    _modelPath = cachedModelPath;
+                    try { File.SetLastWriteTimeUtc(cachedModelPath, DateTime.UtcNow); } catch { }
+                    Application.Instance.Invoke(() => AddRuntimeMessage(GH_RuntimeMessageLevel.Remark, $"Reusing cached model: {_modelPath}"));
+                    try
+                    {
+                        if (!string.IsNullOrEmpty(_videoPath) && File.Exists(_videoPath))
+                            File.Delete(_videoPath);
+                    }
+                    catch { }
+                    _finished = true;
+                    Eto.Forms.Application.Instance.Invoke(() => ExpireSolution(true));
+                    return;
+                }
                 Directory.CreateDirectory(framesDir);
                 // Notify frame extraction start
-                Application.Instance.Invoke(() => AddRuntimeMessage(GH_RuntimeMessageLevel.Remark, "Extracting frames..."));
-                // Extract frames (requires ffmpeg in PATH)
+                Application.Instance.Invoke(() => AddRuntimeMessage(GH_RuntimeMessageLevel.Remark, $"Extracting frames (max {MaxFrameSize} px)..."));
+                // Extract frames (requires ffmpeg in PATH); cap resolution without upscaling smaller videos
                 try
                 {
-                    var psiF = new ProcessStartInfo("ffmpeg", $"-i \"{_videoPath}\" \"{framesDir}/frame_%04d.jpg\"")
+                    var scale = $"scale='min({MaxFrameSize},iw)':'min({MaxFrameSize},ih)':force_original_aspect_ratio=decrease";
+                    var psiF = new ProcessStartInfo("ffmpeg", $"-i \"{_videoPath}\" -vf \"{scale}\" \"{framesDir}/frame_%04d.jpg\"")
                     { RedirectStandardOutput = true, RedirectStandardError = true, UseShellExecute = false, CreateNoWindow = true };
-                    using var pF = Process.Start(psiF);
-                    pF.WaitForExit();
-                    if (pF.ExitCode != 0)
+                    if (RunProcess(psiF, out _) != 0)
                     {
                         AddRuntimeMessage(GH_RuntimeMessageLevel.Warning, "Frame extraction failed.");
                     }
@@ -318,21 +355,29 @@ document.getElementById('uploadForm').addEventListener('submit', function(e) {
                 var exePath = Path.Combine(Directory.GetCurrentDirectory(), "scripts", "photogrammetry", "HelloPhotogrammetry");
                 var parts = new List<string> { framesDir, _modelPath };
                 if (!string.IsNullOrWhiteSpace(_detail)) parts.Add("--detail " + _detail);
-                if (!string.IsNullOrWhiteSpace(_sampleOrdering)) parts.Add("--sample-ordering " + _sampleOrdering);
+                parts.Add("--sample-ordering " + sampleOrdering);
                 if (!string.IsNullOrWhiteSpace(_featureSensitivity)) parts.Add("--feature-sensitivity " + _featureSensitivity);
                 try
                 {
                     var psiP = new ProcessStartInfo(exePath, string.Join(" ", parts))
                     { RedirectStandardOutput = true, RedirectStandardError = true, UseShellExecute = false, CreateNoWindow = true };
-                    using var pP = Process.Start(psiP);
-                    pP.WaitForExit();
-                    if (pP.ExitCode != 0)
+                    if (RunProcess(psiP, out var stderr) != 0)
                     {
-                        AddRuntimeMessage(GH_RuntimeMessageLevel.Error, "Photogrammetry failed: " + pP.StandardError.ReadToEnd());
+                        AddRuntimeMessage(GH_RuntimeMessageLevel.Error, "Photogrammetry failed: " + stderr);
                     }
                     else
                     {
                         Application.Instance.Invoke(() => AddRuntimeMessage(GH_RuntimeMessageLevel.Remark, $"Photogrammetry completed: {_modelPath}"));
+                        if (cachedModelPath != null && File.Exists(_modelPath))
+                        {
+                            try
+                            {
+                                Directory.CreateDirectory(Path.GetDirectoryName(cachedModelPath));
+                                File.Copy(_modelPath, cachedModelPath, true);
+                                PruneModelCache(Path.GetDirectoryName(cachedModelPath));
+                            }
+                            catch { }
+                        }
                     }
                 }
                 catch (Exception e) { AddRuntimeMessage(GH_RuntimeMessageLevel.Error, "Error running photogrammetry: " + e.Message); }
@@ -352,6 +397,47 @@ document.getElementById('uploadForm').addEventListener('submit', function(e) {
             });
         }
 
+        /// <summary>
+        /// Runs a process to completion while draining both redirected pipes, so verbose tools
+        /// (ffmpeg progress, reconstruction logs) cannot stall on a full pipe buffer.
+        /// </summary>
+        private static int RunProcess(ProcessStartInfo psi, out string stderr)
+        {
+            using var p = Process.Start(psi);
+            var errTask = p.StandardError.ReadToEndAsync();
+            p.OutputDataReceived += (s, e) => { };
+            p.BeginOutputReadLine();
+            p.WaitForExit();
+            stderr = errTask.Result;
+            return p.ExitCode;
+        }
+
+        /// <summary>
+        /// Cache location for the model built from the current video and options, or null if the video is unknown.
+        /// </summary>
+        private string GetCachedModelPath(string sampleOrdering)
+        {
+            if (string.IsNullOrEmpty(_videoHash))
+                return null;
+            var key = $"v{ModelCacheVersion}|{MaxFrameSize}|{_videoHash}|{_detail}|{sampleOrdering}|{_featureSensitivity}";
+            var name = Convert.ToHexString(SHA256.HashData(Encoding.UTF8.GetBytes(key)));
+            return Path.Combine(Path.GetTempPath(), "gh_photogrammetry_cache", name + ".usdz");
+        }
+
+        /// <summary>
+        /// Keep only the most recently used cached models.
+        /// </summary>
+        private static void PruneModelCache(string cacheDir)
+        {
+            var stale = new DirectoryInfo(cacheDir).GetFiles("*.usdz")
+                .OrderByDescending(f => f.LastWriteTimeUtc)
+                .Skip(MaxCachedModels);
+            foreach (var file in stale)
+            {
+                try { file.Delete(); } catch { }
+            }
+        }
+
         private int GetFreePort()
         {
             var listener = System.Net.Sockets.TcpListener.Create(0);
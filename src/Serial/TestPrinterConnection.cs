@@ -4,6 +4,7 @@ using System.IO.Ports;
 using System.Text;
 using System.Threading;
 using System.Collections.Generic;
+using System.Collections.Concurrent;
 using System.Runtime.InteropServices;
 using System.Diagnostics;
 
@@ -380,6 +381,33 @@ namespace PrinterTester
             }
         }
         
+        // Maximum time to wait for each firmware response line
+        const int ResponseTimeoutMs = 5000;
+        // Homing, probing and heat-and-wait commands can run for minutes without sending anything
+        const int LongResponseTimeoutMs = 300000;
+
+        // Response deadline for a command, longer for commands that block the firmware
+        static int ResponseTimeoutFor(string command)
+        {
+            string code = command.Trim().Split(' ', ';')[0].ToUpperInvariant();
+            switch (code)
+            {
+                case "G28":
+                case "G29":
+                case "M109":
+                case "M190":
+                    return LongResponseTimeoutMs;
+                default:
+                    return ResponseTimeoutMs;
+            }
+        }
+
+        // Explains why no response line could be taken from the reader queue
+        static string NoResponseMessage(BlockingCollection<string> lines)
+        {
+            return lines.IsAddingCompleted ? "[Port closed while waiting for ok]" : "[Timeout waiting for ok]";
+        }
+
         // Interactive command loop using Method 1 (System.IO.Ports)
         static void InteractiveCommandLoopMethod1(string portName, int baudRate)
         {
@@ -387,9 +415,10 @@ namespace PrinterTester
             {
                 using (SerialPort port = new SerialPort(portName, baudRate, Parity.None, 8, StopBits.One))
                 {
+                    // Short read timeout only paces the reader thread; response deadlines are enforced on the queue
                     port.ReadTimeout = 1000;
                     port.WriteTimeout = 1000;
-                    port.NewLine = "\r\n";  // Explicit CRLF for 3D printers
+                    port.NewLine = "\n";  // Firmware replies end in LF (optionally preceded by CR)
 
                     // Open the port
                     Console.WriteLine($"Opening port {portName} for interactive mode...");
@@ -400,6 +429,11 @@ namespace PrinterTester
                     port.DiscardInBuffer();
                     port.DiscardOutBuffer();
 
+                    // Keep draining the port while the prompt blocks on console input, so unsolicited
+                    // firmware output (temperature auto-reports, busy messages) never backs up
+                    var lines = new BlockingCollection<string>();
+                    StartReader(port, lines);
+
                     // Interactive loop
                     while (true)
                     {
@@ -414,13 +448,10 @@ namespace PrinterTester
                         if (input.Equals("test", StringComparison.OrdinalIgnoreCase))
                         {
                             string[] testCommands = new[] { "M115", "M105", "G28" };
-                            foreach (var cmd in testCommands)
-                            {
-                                SendCommandPort(port, cmd);
-                            }
+                            SendCommandsPipelined(port, lines, testCommands);
                             continue;
                         }
-                        SendCommandPort(port, input);
+                        SendCommandPort(port, lines, input);
                     }
 
                     port.Close();
@@ -433,27 +464,74 @@ namespace PrinterTester
             }
         }
 
-        // Helper for sending commands over SerialPort
-        static void SendCommandPort(SerialPort port, string command)
+        // Background reader: pushes every received line into the queue until the port is closed
+        static void StartReader(SerialPort port, BlockingCollection<string> lines)
         {
+            Thread reader = new Thread(() =>
+            {
+                try
+                {
+                    while (port.IsOpen)
+                    {
+                        try
+                        {
+                            lines.Add(port.ReadLine().TrimEnd('\r'));
+                        }
+                        catch (TimeoutException) { }
+                    }
+                }
+                catch (Exception) { /* Port closed */ }
+                finally
+                {
+                    lines.CompleteAdding();
+                }
+            }) { IsBackground = true };
+            reader.Start();
+        }
+
+        // Prints lines that arrived while no command was waiting on them
+        static void DrainUnsolicited(BlockingCollection<string> lines)
+        {
+            while (lines.TryTake(out string line))
+                Console.WriteLine($"Unsolicited: {line}");
+        }
+
+        // Helper for sending commands over SerialPort; blocks until the firmware acknowledges with "ok"
+        static void SendCommandPort(SerialPort port, BlockingCollection<string> lines, string command)
+        {
+            DrainUnsolicited(lines);
+
+            // Blank and comment-only lines are ignored by the firmware and never acknowledged
+            string code = command.Split(';')[0].Trim();
+            if (code.Length == 0)
+                return;
+
             string cmd = command.EndsWith("\r\n") ? command : command + "\r\n";
             byte[] bytes = Encoding.ASCII.GetBytes(cmd);
             Console.WriteLine($"Sending bytes: {BitConverter.ToString(bytes)}");
             port.Write(bytes, 0, bytes.Length);
             port.BaseStream.Flush();
-            Thread.Sleep(500);
 
+            // Emergency stop halts the firmware without an "ok"
+            if (code.Split(' ')[0].Equals("M112", StringComparison.OrdinalIgnoreCase))
+            {
+                Console.WriteLine("[Emergency stop sent; no ok expected]");
+                return;
+            }
+
+            // Multi-line replies (e.g. M115) are collected until the terminating "ok" line
             StringBuilder response = new StringBuilder();
-            try
+            while (true)
             {
-                while (port.BytesToRead > 0)
+                if (!lines.TryTake(out string line, ResponseTimeoutFor(command)))
                 {
-                    byte[] buffer = new byte[port.BytesToRead];
-                    int bytesRead = port.Read(buffer, 0, buffer.Length);
-                    response.Append(Encoding.ASCII.GetString(buffer, 0, bytesRead));
+                    response.Append(NoResponseMessage(lines));
+                    break;
                 }
+                response.AppendLine(line);
+                if (line.StartsWith("ok", StringComparison.OrdinalIgnoreCase))
+                    break;
             }
-            catch (TimeoutException) { }
 
             if (response.Length > 0)
                 Console.WriteLine($"Response: {response}");
@@ -461,6 +539,42 @@ namespace PrinterTester
                 Console.WriteLine("[No response]");
         }
 
+        // Streams commands over SerialPort keeping up to `window` unacknowledged lines queued in the firmware,
+        // so throughput is bound by the baud rate rather than one round trip per command
+        static void SendCommandsPipelined(SerialPort port, BlockingCollection<string> lines, IList<string> commands, int window = 4)
+        {
+            DrainUnsolicited(lines);
+
+            int sent = 0;
+            int acked = 0;
+            while (acked < commands.Count)
+            {
+                // Fill the window
+                while (sent < commands.Count && sent - acked < window)
+                {
+                    string command = commands[sent++];
+                    string cmd = command.EndsWith("\r\n") ? command : command + "\r\n";
+                    byte[] bytes = Encoding.ASCII.GetBytes(cmd);
+                    Console.WriteLine($"Sending bytes: {BitConverter.ToString(bytes)}");
+                    port.Write(bytes, 0, bytes.Length);
+                }
+                port.BaseStream.Flush();
+
+                // Every "ok" frees one slot; wait as long as the slowest command still in flight needs
+                int timeout = ResponseTimeoutMs;
+                for (int i = acked; i < sent; i++)
+                    timeout = Math.Max(timeout, ResponseTimeoutFor(commands[i]));
+                if (!lines.TryTake(out string line, timeout))
+                {
+                    Console.WriteLine(NoResponseMessage(lines));
+                    return;
+                }
+                Console.WriteLine($"Response: {line}");
+                if (line.StartsWith("ok", StringComparison.OrdinalIgnoreCase))
+                    acked++;
+            }
+        }
+
         // Interactive command loop using Method 2 (direct file stream)
         static void InteractiveCommandLoopMethod2(string portName, int baudRate)
         {